@@ -22,13 +22,13 @@ __doctest_requires__ = {
 
 import os
 from abc import ABC
-from functools import wraps
+from functools import wraps, lru_cache
 import inspect
 import json
 
 import numpy as np
 from astropy.utils.state import ScienceState
-from astropy.utils.data import get_pkg_data_path
+from astropy.utils.data import get_pkg_data_path, _is_url
 from astropy.table import Table
 import astropy.units as u
 
@@ -113,8 +113,6 @@ class SpectralStandard(SpectralSource, ABC):
 
         """
 
-        from astropy.utils.data import _is_url
-
         try:
             parameters = getattr(cls._sources, name).copy()
         except AttributeError:
@@ -208,7 +206,12 @@ class SpectralStandard(SpectralSource, ABC):
 
         """
 
-        if isinstance(wfb, (list, tuple)):
+        if isinstance(wfb, u.Quantity):
+            if interpolate:
+                fluxd = self(wfb, unit=unit)
+            else:
+                fluxd = self.observe_spectrum(wfb, unit=unit, **kwargs)
+        elif isinstance(wfb, (list, tuple)):
             fluxd = []
             for i in range(len(wfb)):
                 fluxd.append(self.observe(wfb[i], unit=unit,
@@ -218,11 +221,6 @@ class SpectralStandard(SpectralSource, ABC):
         elif isinstance(wfb, str):
             lambda_eff, lambda_pivot, fluxd = self.observe_filter_name(
                 wfb, unit=unit)
-        elif isinstance(wfb, u.Quantity):
-            if interpolate:
-                fluxd = self(wfb, unit=unit)
-            else:
-                fluxd = self.observe_spectrum(wfb, unit=unit, **kwargs)
         elif isinstance(wfb, SpectralElement):
             lambda_eff, fluxd = self.observe_bandpass(wfb, unit=unit,
                                                       **kwargs)
@@ -367,6 +365,18 @@ class SpectralStandard(SpectralSource, ABC):
         return u.Quantity(eff_wave), ci
 
 
+@lru_cache(maxsize=None)
+def _builtin_standard(cls, name):
+    """Built-in spectral standard, loaded once per name.
+
+    Science states re-validate their value on every ``get()``, so
+    without this the default spectra would be read from disk each time
+    they are used.
+
+    """
+    return cls.from_builtin(name)
+
+
 class solar_spectrum(ScienceState):
     """Get/set the `sbpy` default solar spectrum.
 
@@ -393,7 +403,7 @@ class solar_spectrum(ScienceState):
     @classmethod
     def validate(cls, value):
         if isinstance(value, str):
-            return Sun.from_builtin(value)
+            return _builtin_standard(Sun, value)
         elif isinstance(value, Sun):
             return value
         else:
@@ -420,7 +430,7 @@ class vega_spectrum(ScienceState):
     @classmethod
     def validate(cls, value):
         if isinstance(value, str):
-            return Vega.from_builtin(value)
+            return _builtin_standard(Vega, value)
         elif isinstance(value, Vega):
             return value
         else:
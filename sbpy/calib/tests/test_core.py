@@ -241,6 +241,11 @@ class Test_solar_spectrum:
         pytest.importorskip("synphot")
         assert isinstance(solar_spectrum.validate("E490_2014"), Sun)
 
+    def test_get_cached(self):
+        pytest.importorskip("synphot")
+        # the default spectrum is loaded once, not on every get()
+        assert solar_spectrum.get() is solar_spectrum.get()
+
     def test_validate_Sun(self):
         pytest.importorskip("synphot")
         wave = [1, 2] * u.um
@@ -291,6 +296,11 @@ class Test_vega_spectrum:
         pytest.importorskip("synphot")
         assert isinstance(vega_spectrum.validate("Bohlin2014"), Vega)
 
+    def test_get_cached(self):
+        pytest.importorskip("synphot")
+        # the default spectrum is loaded once, not on every get()
+        assert vega_spectrum.get() is vega_spectrum.get()
+
     def test_validate_Vega(self):
         pytest.importorskip("synphot")
         wave = [1, 2] * u.um
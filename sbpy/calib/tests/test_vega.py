@@ -13,6 +13,13 @@ class Star(core.SpectralStandard):
     pass
 
 
+@pytest.fixture(scope="module")
+def default_vega():
+    """Default Vega spectrum, loaded once for the whole module."""
+    pytest.importorskip("synphot")
+    return Vega.from_default()
+
+
 class TestVega:
     def test___repr__(self):
         pytest.importorskip("synphot")
@@ -26,10 +33,8 @@ class TestVega:
     @pytest.mark.parametrize('fluxd0', (
         u.Quantity(3.44e-8, 'W/(m2 um)'), 1 * sbu.VEGA
     ))
-    def test_call_wavelength(self, fluxd0):
-        pytest.importorskip("synphot")
-        vega = Vega.from_default()
-        fluxd = vega(5557.5 * u.AA, unit=fluxd0.unit)
+    def test_call_wavelength(self, fluxd0, default_vega):
+        fluxd = default_vega(5557.5 * u.AA, unit=fluxd0.unit)
         assert np.isclose(fluxd.value, fluxd0.value)
 
     @patch.dict("sys.modules", {"synphot": None})
@@ -100,50 +105,42 @@ class TestVega:
 
         assert np.allclose(fluxd.value, [1, 2])
 
-    def test_color_index_wavelength(self):
+    def test_color_index_wavelength(self, default_vega):
         """Compare to Willmer 2018.
 
         ABmag:
         V - I = -0.013 - 0.414 = -0.427
 
         """
-        pytest.importorskip("synphot")
         w = [5476, 7993] * u.AA
-        vega = Vega.from_default()
-        lambda_eff, ci = vega.color_index(w, u.ABmag)
+        lambda_eff, ci = default_vega.color_index(w, u.ABmag)
         assert np.allclose(lambda_eff.value, w.value)
         assert np.isclose(ci.value, -0.427, atol=0.02)
 
-    def test_color_index_frequency(self):
+    def test_color_index_frequency(self, default_vega):
         """Check that frequency is correctly coverted to wavelength."""
-        pytest.importorskip("synphot")
         w = [0.5476, 0.7993] * u.um
         f = w.to(u.Hz, u.spectral())
-        vega = Vega.from_default()
-        lambda_eff, ci = vega.color_index(f, u.ABmag)
+        lambda_eff, ci = default_vega.color_index(f, u.ABmag)
         assert np.allclose(lambda_eff.value, w.value)
 
-    def test_color_index_bandpass(self):
-        pytest.importorskip("synphot")
+    def test_color_index_bandpass(self, default_vega):
         """Compare to Willmer 2018."""
         bp = (bandpass('johnson v'), bandpass('cousins i'))
-        vega = Vega.from_default()
-        lambda_eff, ci = vega.color_index(bp, u.ABmag)
+        lambda_eff, ci = default_vega.color_index(bp, u.ABmag)
         # I bandpass seems to be very different:
         assert np.allclose(lambda_eff.to('AA').value,
                            [5476, 7993], atol=150)
         assert np.isclose(ci.value, -0.427, atol=0.02)
 
-    def test_color_index_filter(self):
-        pytest.importorskip("synphot")
-        vega = Vega.from_default()
+    def test_color_index_filter(self, default_vega):
         with vega_fluxd.set({
                 'V': -0.013 * u.ABmag,
                 'V(lambda eff)': 5476 * u.AA,
                 'I': 0.414 * u.ABmag,
                 'I(lambda eff)': 7993 * u.AA
         }):
-            lambda_eff, ci = vega.color_index(('V', 'I'), u.ABmag)
+            lambda_eff, ci = default_vega.color_index(('V', 'I'), u.ABmag)
 
         assert np.allclose(lambda_eff.value, [5476, 7993])
         assert np.isclose(ci.value, -0.427)
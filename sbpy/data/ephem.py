@@ -187,7 +187,7 @@ class Ephem(DataClass):
                         'elevation': location.height.to('km')}
 
         # append ephemerides table for each targetid
-        all_eph = None
+        all_eph = []
         for targetid in targetids:
 
             # load ephemerides using astroquery.jplhorizons
@@ -219,10 +219,9 @@ class Ephem(DataClass):
             if 'RA_rate' in eph.colnames:
                 eph['RA_rate'].name = 'RA*cos(Dec)_rate'
 
-            if all_eph is None:
-                all_eph = eph
-            else:
-                all_eph = vstack([all_eph, eph])
+            all_eph.append(eph)
+
+        all_eph = vstack(all_eph)
 
         # turn epochs into astropy.time.Time and apply timescale
         # convert ut1 epochs to utc
@@ -425,7 +424,7 @@ class Ephem(DataClass):
             raise ValueError('Invalid `epochs` parameter')
 
         # append ephemerides table for each targetid
-        all_eph = None
+        all_eph = []
         for targetid in targetids:
             try:
                 # get ephemeris
@@ -452,12 +451,9 @@ class Ephem(DataClass):
             eph.add_column(Column([targetid]*len(eph),
                                   name='Targetname'), index=0)
 
-            if all_eph is None:
-                all_eph = eph
-            else:
-                all_eph = vstack([all_eph, eph])
+            all_eph.append(eph)
 
-        all_eph = QTable(all_eph)
+        all_eph = QTable(vstack(all_eph))
 
         # convert RA and Dec to Angle
         all_eph['RA'] = Angle(all_eph['RA'], all_eph['RA'].unit)
@@ -603,7 +599,7 @@ class Ephem(DataClass):
                 location.height.to('m').value)
 
         # append ephemerides table for each targetid
-        all_eph = None
+        all_eph = []
         for targetid in targetids:
             query = Miriade()
             try:
@@ -642,12 +638,9 @@ class Ephem(DataClass):
                      'The following query was attempted: {:s}').format(
                          str(e), query.uri))
 
-            if all_eph is None:
-                all_eph = eph
-            else:
-                all_eph = vstack([all_eph, eph])
+            all_eph.append(eph)
 
-        all_eph = QTable(all_eph)
+        all_eph = QTable(vstack(all_eph))
         all_eph['epoch'] = Time(all_eph['epoch'], scale='utc', format='jd')
         return cls.from_table(all_eph)
 
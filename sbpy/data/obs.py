@@ -172,15 +172,11 @@ class Obs(Ephem):
             raise QueryError('cannot use field {} as id_field.'.format(
                 id_field))
 
-        all_obs = None
-        all_eph = None
+        all_obs = []
+        all_eph = []
         for targetid in targetids:
 
-            if all_obs is None:
-                all_obs = self.table[self[id_field] == targetid]
-            else:
-                all_obs = vstack([all_obs,
-                                  self.table[self[id_field] == targetid]])
+            all_obs.append(self.table[self[id_field] == targetid])
 
             if service == 'jplhorizons':
                 eph = Ephem.from_horizons(
@@ -206,10 +202,10 @@ class Obs(Ephem):
             else:
                 raise QueryError('service {} not known.'.format(service))
 
-            if all_eph is None:
-                all_eph = eph.table
-            else:
-                all_eph = vstack([all_eph, eph.table])
+            all_eph.append(eph.table)
+
+        all_obs = vstack(all_obs)
+        all_eph = vstack(all_eph)
 
         # identify field names that both obs and eph have in common
         fieldnames_intersect = set(all_eph.columns).intersection(
@@ -161,7 +161,7 @@ class Orbit(DataClass):
             targetids = [targetids]
 
         # append elements table for each targetid
-        all_elem = None
+        all_elem = []
         for targetid in targetids:
 
             # load elements using astroquery.jplhorizons
@@ -183,10 +183,9 @@ class Orbit(DataClass):
                 if elem[column_name].unit == '---':
                     elem[column_name].unit = None
 
-            if all_elem is None:
-                all_elem = elem
-            else:
-                all_elem = vstack([all_elem, elem])
+            all_elem.append(elem)
+
+        all_elem = vstack(all_elem)
 
         # turn epochs into astropy.time.Time and apply timescale
         # https://ssd.jpl.nasa.gov/?horizons_doc
@@ -278,7 +277,7 @@ class Orbit(DataClass):
                     id_type = 'number'
 
         # append ephemerides table for each targetid
-        all_elem = None
+        all_elem = []
         for targetid in targetids:
 
             # get elements
@@ -316,12 +315,9 @@ class Orbit(DataClass):
                         continue
                     results[fieldname] = [val]*u.Unit(fieldunit)
 
-            if all_elem is None:
-                all_elem = QTable(results)
-            else:
-                all_elem = vstack([all_elem, QTable(results)])
+            all_elem.append(QTable(results))
 
-        return cls.from_table(all_elem)
+        return cls.from_table(vstack(all_elem))
 
     # functions using pyoorb
 
@@ -207,7 +207,7 @@ class SpectralSource(ABC):
 
         if unit.is_equivalent(sbu.VEGA):
             fluxd = self.source(wave_or_freq, 'W/(m2 um)').to(
-                unit, sbu.spectral_density_vega(wave_or_freq))
+                unit, sbu.spectral_density_vega(wave_or_freq, which='flam'))
         else:
             fluxd = self.source(wave_or_freq, unit)
 
@@ -261,14 +261,14 @@ class SpectralSource(ABC):
 
         """
 
-        if isinstance(wfb, (list, tuple, SpectralElement)):
-            lambda_eff, fluxd = self.observe_bandpass(
-                wfb, unit=unit, **kwargs)
-        elif isinstance(wfb, u.Quantity):
+        if isinstance(wfb, u.Quantity):
             if interpolate:
                 fluxd = self(wfb, unit=unit)
             else:
                 fluxd = self.observe_spectrum(wfb, unit=unit, **kwargs)
+        elif isinstance(wfb, (list, tuple, SpectralElement)):
+            lambda_eff, fluxd = self.observe_bandpass(
+                wfb, unit=unit, **kwargs)
         else:
             raise TypeError('Unsupported type for `wfb` type: {}'
                             .format(type(wfb)))
@@ -326,7 +326,8 @@ class SpectralSource(ABC):
             _fluxd = obs.effstim('W/(m2 um)')
 
             if unit.is_equivalent(sbu.VEGAmag):
-                fluxd[i] = _fluxd.to(unit, sbu.spectral_density_vega(bp[i]))
+                fluxd[i] = _fluxd.to(
+                    unit, sbu.spectral_density_vega(bp[i], which='flam'))
             else:
                 fluxd[i] = _fluxd.to(unit, u.spectral_density(lambda_pivot))
 
@@ -413,7 +414,7 @@ class SpectralSource(ABC):
 
         if unit.is_equivalent(sbu.VEGAmag):
             fluxd = obs.sample_binned(flux_unit='W/(m2 um)').to(
-                unit, sbu.spectral_density_vega(wave_or_freq))
+                unit, sbu.spectral_density_vega(wave_or_freq, which='flam'))
         else:
             fluxd = obs.sample_binned(flux_unit=unit)
 
@@ -30,6 +30,7 @@ __doctest_requires__ = {
     "spectral_density_vega": ["synphot"]
 }
 
+import sys
 from warnings import warn
 import numpy as np
 import astropy.units as u
@@ -48,7 +49,11 @@ VEGA = u.def_unit(['VEGA', 'VEGAflux'],
 VEGAmag = u.MagUnit(VEGA)
 VEGAmag.__doc__ = "Vega-based magnitude: Vega is 0 mag at all wavelengths"
 
-JM = u.def_unit(['JM', 'JMflux'], represents=VEGA * 10**(0.4 * 0.03),
+# Vega is 0.03 mag in the Johnson-Morgan system: 10**(0.4 * 0.03)
+# = 1.0280162981264735
+_JM_FACTOR = 10**(0.4 * 0.03)
+
+JM = u.def_unit(['JM', 'JMflux'], represents=VEGA * _JM_FACTOR,
                 doc=('Johnson-Morgan magnitude system flux density '
                      'zeropoint (Johnson et al 1966; Bessell & Murphy '
                      '2012).'))
@@ -62,6 +67,23 @@ hundred_nm = u.def_unit('100 nm', represents=100 * u.nm,
                         doc=('Convenience unit for expressing spectral '
                              'gradients.'))
 
+# flux density units for Vega and solar equivalencies, parsed once;
+# kept in containers because enable() registers every unit in this module
+_VEGA_FLUXD_UNITS = {
+    'both': (u.Unit('W/(m2 Hz)'), u.Unit('W/(m2 um)')),
+    'fnu': (u.Unit('W/(m2 Hz)'),),
+    'flam': (u.Unit('W/(m2 um)'),),
+}
+_SOLAR_FLUXD_UNITS = (u.Unit('W/(m2 um)'), u.Unit('W/(m2 Hz)'), VEGA)
+
+# dimensionless logarithmic units supported by reflectance, and the
+# equivalency for converting them, built once rather than per conversion
+_LOGARITHMIC_UNITS = (u.mag, u.dB, u.dex)
+_LOGARITHMIC = u.logarithmic()
+
+# km2 per au2, for cross-section conversions
+_AU2_TO_KM2 = const.au.to_value(u.km)**2
+
 
 def enable():
     """Enable `sbpy` units in the top-level `astropy.units` namespace.
@@ -72,11 +94,10 @@ def enable():
     May be used with the ``with`` statement to enable them temporarily.
 
     """
-    import inspect
-    return u.add_enabled_units(inspect.getmodule(enable))
+    return u.add_enabled_units(sys.modules[__name__])
 
 
-def spectral_density_vega(wfb):
+def spectral_density_vega(wfb, which='both'):
     """Flux density equivalencies with Vega-based magnitude systems.
 
     Uses the default `sbpy` Vega spectrum, or `~sbpy.calib.vega_fluxd`.
@@ -94,6 +115,13 @@ def spectral_density_vega(wfb):
         :func:`~synphot.SpectralElement.from_filter()` for possible
         bandpass names.
 
+    which : string, optional
+        Which physical flux density equivalencies to return: ``'fnu'``
+        for W/(m2 Hz), ``'flam'`` for W/(m2 um), or ``'both'``.  Each
+        requires an evaluation of the Vega spectrum, so request only the
+        one needed, e.g., when converting from a known flux density
+        unit.
+
 
     Returns
     -------
@@ -135,17 +163,29 @@ def spectral_density_vega(wfb):
 
     """
 
+    if which not in ('both', 'fnu', 'flam'):
+        raise ValueError(
+            "which must be 'both', 'fnu', or 'flam', not {!r}".format(which))
+    units = _VEGA_FLUXD_UNITS[which]
+
     vega = Vega.from_default()
 
     # warn rather than raise exceptions so that code that uses
     # spectral_density_vega when it doesn't need it will still run.
     equiv = []
-    for unit in ['W/(m2 Hz)', 'W/(m2 um)']:
+    fluxd0 = None
+    for unit in units:
         try:
-            try:
-                fluxd0 = vega.observe(wfb, unit=unit)
-            except SinglePointSpectrumError:
-                fluxd0 = vega(wfb, unit=unit)
+            if (fluxd0 is not None and isinstance(wfb, u.Quantity)
+                    and wfb.size == 1):
+                # Vega was already evaluated at this wavelength or
+                # frequency, convert rather than evaluate it again
+                fluxd0 = fluxd0.to(unit, u.spectral_density(wfb))
+            else:
+                try:
+                    fluxd0 = vega.observe(wfb, unit=unit)
+                except SinglePointSpectrumError:
+                    fluxd0 = vega(wfb, unit=unit)
 
             # pass fluxd0 as an optional argument to dereference it,
             # otherwise both equivalencies will use the fluxd0 for
@@ -156,17 +196,65 @@ def spectral_density_vega(wfb):
                 lambda f_vega, fluxd0=fluxd0.value: f_vega * fluxd0
             ))
         except RequiredPackageUnavailable:
-            warn(OptionalPackageUnavailable(
-                'synphot is required for Vega-based magnitude conversions'
-                ' with {}'.format(wfb)))
+            warn('synphot is required for Vega-based magnitude conversions'
+                 ' with {}'.format(wfb), OptionalPackageUnavailable,
+                 stacklevel=2)
+            # the other flux density unit needs synphot too
+            break
         except UndefinedSourceError:
             pass
         except u.UnitConversionError as e:
-            warn(SbpyWarning(str(e)))
+            warn(str(e), SbpyWarning, stacklevel=2)
 
     return equiv
 
 
+def _solar_fluxd(wfb, **kwargs):
+    """Solar flux density at 1 au in the units supported by `reflectance`.
+
+
+    Parameters
+    ----------
+    wfb : `astropy.units.Quantity`, `synphot.SpectralElement`, string
+        Wavelength, frequency, or a bandpass.
+
+    **kwargs
+        Keyword arguments for `~Sun.observe()`.
+
+
+    Returns
+    -------
+    f_sun : list of `~astropy.units.Quantity`
+        The solar flux densities that could be computed, possibly none.
+
+    """
+
+    f_sun = []
+    sun = Sun.from_default()
+    for unit in _SOLAR_FLUXD_UNITS:
+        try:
+            if (unit is VEGA and len(f_sun) > 0
+                    and f_sun[0].unit == _SOLAR_FLUXD_UNITS[0]
+                    and not isinstance(wfb, str)):
+                # observing in VEGA units would observe the Sun in
+                # W/(m2 um) again, then convert: reuse that result
+                f_sun.append(f_sun[0].to(
+                    VEGA, spectral_density_vega(wfb, which='flam')))
+            else:
+                f_sun.append(sun.observe(wfb, unit=unit, **kwargs))
+        except SinglePointSpectrumError:
+            f_sun.append(sun(wfb, unit=unit))
+        except (u.UnitConversionError, FilterLookupError):
+            pass
+    if len(f_sun) == 0:
+        try:
+            f_sun.append(sun.observe(wfb, **kwargs))
+        except (SinglePointSpectrumError, u.UnitConversionError, FilterLookupError):
+            pass
+
+    return f_sun
+
+
 @u.quantity_input(cross_section='km2', reflectance='1/sr')
 def reflectance(wfb, cross_section=None, reflectance=None, **kwargs):
     """Reflectance related equivalencies.
@@ -239,65 +327,42 @@ def reflectance(wfb, cross_section=None, reflectance=None, **kwargs):
 
     """
 
-    # Solar flux density at 1 au in different units
-    f_sun = []
-    sun = Sun.from_default()
-    for unit in ('W/(m2 um)', 'W/(m2 Hz)', VEGA):
-        try:
-            f_sun.append(sun.observe(wfb, unit=unit, **kwargs))
-        except SinglePointSpectrumError:
-            f_sun.append(sun(wfb, unit=unit))
-        except (u.UnitConversionError, FilterLookupError):
-            pass
-    if len(f_sun) == 0:
-        try:
-            f_sun.append(sun.observe(wfb, **kwargs))
-        except (SinglePointSpectrumError, u.UnitConversionError, FilterLookupError):
-            pass
-
-    # pass fluxd0 as an optional argument to dereference it,
-    # otherwise both equivalencies will use the fluxd0 for
-    # the last item in f_sun
-    equiv = []
     if cross_section is not None:
-        xsec = cross_section.to('au2').value
-        for fluxd0 in f_sun:
-            if fluxd0.unit in [u.mag, u.dB, u.dex]:
-                equiv.append((
-                    fluxd0.unit, u.sr**-1,
-                    lambda mag, mag0=fluxd0.value: u.Quantity(mag - mag0,
-                        fluxd0.unit).to('', u.logarithmic()).value / xsec,
-                    lambda ref, mag0=fluxd0.value: u.Quantity(ref * xsec).to(
-                        fluxd0.unit, u.logarithmic()).value + mag0
-                    ))
-            else:
-                equiv.append((
-                    fluxd0.unit, u.sr**-1,
-                    lambda fluxd, fluxd0=fluxd0.value: fluxd / (fluxd0 * xsec),
-                    lambda ref, fluxd0=fluxd0.value: ref * fluxd0 * xsec
-                ))
+        # reflectance = fluxd / (fluxd_sun * cross_section / au2)
+        scale = cross_section.to_value('au2')
+        target = u.sr**-1
     elif reflectance is not None:
-        ref = reflectance.to('1/sr').value
-        au2km = (const.au.to('km')**2).value
-        for fluxd0 in f_sun:
-            if fluxd0.unit in [u.mag, u.dB, u.dex]:
-                equiv.append((
-                    fluxd0.unit, u.km**2,
-                    lambda mag, mag0=fluxd0.value: u.Quantity(mag - mag0,
-                        fluxd0.unit).to('', u.logarithmic()).value / ref *
-                        au2km,
-                    lambda xsec, mag0=fluxd0.value: u.Quantity(ref *
-                        xsec / au2km).to(fluxd0.unit, u.logarithmic()).value
-                        + mag0
-                    ))
-            else:
-                equiv.append((
-                    fluxd0.unit, u.km**2,
-                    lambda fluxd, fluxd0=fluxd0.value: (
-                        fluxd / (fluxd0 * ref) * au2km),
-                    lambda xsec, fluxd0=fluxd0.value: (
-                        fluxd0 * ref * xsec / au2km)
-                ))
+        # cross_section = fluxd / (fluxd_sun * reflectance) * au2
+        scale = reflectance.to_value('1/sr') / _AU2_TO_KM2
+        target = u.km**2
+    else:
+        return []
+
+    # pass the scale factor k and unit as optional arguments to
+    # dereference them, otherwise all equivalencies will use the values
+    # for the last solar flux density; k is a plain number (or an array
+    # for spectra) rather than a Quantity
+    equiv = []
+    for fluxd0 in _solar_fluxd(wfb, **kwargs):
+        unit = fluxd0.unit
+        if unit in _LOGARITHMIC_UNITS:
+            # solar magnitude converted to a linear scale factor once,
+            # rather than on every conversion
+            k = fluxd0.to_value(u.one, _LOGARITHMIC) * scale
+            equiv.append((
+                unit, target,
+                lambda mag, unit=unit, k=k: u.Quantity(mag,
+                    unit).to_value(u.one, _LOGARITHMIC) / k,
+                lambda x, unit=unit, k=k: u.Quantity(
+                    x * k).to_value(unit, _LOGARITHMIC)
+            ))
+        else:
+            k = fluxd0.value * scale
+            equiv.append((
+                unit, target,
+                lambda fluxd, k=k: fluxd / k,
+                lambda x, k=k: x * k
+            ))
     return equiv
 
 
@@ -336,7 +401,7 @@ def projected_size(eph: sbd.Ephem):
 
     """
 
-    delta = eph['delta'].to('m').value
+    delta = eph['delta'].to_value(u.m)
 
     equiv = [(
         u.rad, u.m,
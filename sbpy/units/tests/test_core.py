@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
 import os
+from unittest.mock import patch
 import pytest
 import numpy as np
 import astropy.units as u
@@ -12,7 +13,7 @@ from ..core import *
 from ...photometry import bandpass
 from ...calib import (vega_spectrum, vega_fluxd, solar_fluxd,
                       solar_spectrum, Sun, Vega)
-from ...exceptions import RequiredPackageUnavailable
+from ...exceptions import RequiredPackageUnavailable, OptionalPackageUnavailable
 
 
 @pytest.mark.parametrize('unit,test', (
@@ -102,12 +103,44 @@ def test_spectral_density_vega_bp(filename, fluxd, to, tol):
         assert np.isclose(v.value, to.value, rtol=tol)
 
 
+@pytest.mark.parametrize('which, units', (
+    ('both', ('W/(m2 Hz)', 'W/(m2 um)')),
+    ('fnu', ('W/(m2 Hz)',)),
+    ('flam', ('W/(m2 um)',)),
+))
+def test_spectral_density_vega_which(which, units):
+    pytest.importorskip("synphot")
+    equiv = spectral_density_vega(5557.5 * u.AA, which=which)
+    assert [eq[0] for eq in equiv] == [u.Unit(unit) for unit in units]
+
+    fluxd = (0 * VEGAmag).to(units[-1], equiv)
+    test = (0 * VEGAmag).to(units[-1], spectral_density_vega(5557.5 * u.AA))
+    assert np.isclose(fluxd.value, test.value)
+
+
+@pytest.mark.parametrize('which', ('fnu and flam', ['fnu'], None))
+def test_spectral_density_vega_which_error(which):
+    with pytest.raises(ValueError):
+        spectral_density_vega(5557.5 * u.AA, which=which)
+
+
 def test_spectral_density_vega_undefinedsourceerror():
     pytest.importorskip("synphot")
     with vega_spectrum.set(Vega(None)):
         assert spectral_density_vega([1, 2, 3] * u.um) == []
 
 
+@patch.dict("sys.modules", {"synphot": None})
+def test_spectral_density_vega_synphot_unavailable():
+    with pytest.warns(OptionalPackageUnavailable) as record:
+        assert spectral_density_vega(5500 * u.AA) == []
+
+    # warned once, not once per flux density unit
+    messages = [str(w.message) for w in record
+                if 'Vega-based magnitude conversions' in str(w.message)]
+    assert len(messages) == 1
+
+
 @pytest.mark.parametrize('fluxd, wfb, f_sun, ref', (
     (3.4 * VEGAmag, "Johnson V", None, 0.02865984),
     (3.4 * VEGAmag, 5500 * u.AA, None, 0.02774623),
@@ -184,6 +217,38 @@ def test_reflectance_xsec(fluxd, wfb, f_sun, radius):
     assert np.isclose(ra.value, radius)
 
 
+@pytest.mark.parametrize('fluxd', (
+    [1.56644783e-09, 1.56644783e-09] * VEGA,
+    [22, 21] * VEGAmag,
+))
+@pytest.mark.parametrize('unit', ('W/(m2 um)', 'Jy'))
+def test_reflectance_filter_list(fluxd, unit):
+    """Test conversion from Vega-based units with a list of filter names.
+
+    For ``Jy`` the solar flux density cannot be expressed in W/(m2 um)
+    since no pivot wavelengths are given.
+
+    """
+
+    pytest.importorskip("synphot")
+
+    f_vega = u.Quantity([3631, 3000], unit)
+    f_sun = u.Quantity([1.8e14, 2e14], unit)
+    xsec = 6.648e5 * u.km**2
+
+    cal = {'V': f_vega[0], 'R': f_vega[1]}
+    with vega_fluxd.set(cal):
+        cal = {'V': f_sun[0], 'R': f_sun[1]}
+        with solar_fluxd.set(cal):
+            r = fluxd.to('1/sr', reflectance(['V', 'R'],
+                                             cross_section=xsec))
+
+    ref = (fluxd.to_value(VEGA) / (f_sun / f_vega).value
+           / xsec.to_value('au2'))
+    assert r.unit == u.sr**-1
+    assert np.allclose(r.value, ref)
+
+
 def test_reflectance_exception():
     assert reflectance('B', reflectance=1/u.sr) == []
 